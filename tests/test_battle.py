@@ -1,4 +1,4 @@
-from wild_west_strategy.battle import resolve_battle
+from wild_west_strategy.battle import resolve_battle, resolve_battles_batch
 from wild_west_strategy.entities import army_from_templates
 
 
@@ -8,3 +8,19 @@ def test_battle_resolves_with_seed():
     report = resolve_battle(attackers, defenders, seed=42)
     assert report.attacker_won is True
     assert report.rounds <= 20
+
+
+def test_batch_rollouts_leave_armies_untouched():
+    attackers = army_from_templates("Attackers", ["militia", "cavalry"])
+    defenders = army_from_templates("Defenders", ["militia"])
+    wins = resolve_battles_batch(attackers, defenders, seeds=range(8))
+    assert wins.shape == (8,)
+    assert all(unit.health == 100 for unit in attackers.units + defenders.units)
+
+
+def test_large_battle_resolves():
+    attackers = army_from_templates("Attackers", ["militia"] * 31)
+    defenders = army_from_templates("Defenders", ["militia"])
+    report = resolve_battle(attackers, defenders, seed=7)
+    assert report.attacker_won is True
+    assert report.rounds <= 20
@@ -33,6 +33,20 @@ def test_build_structure_consumes_treasury_and_levels_up():
     assert faction.treasury == initial_treasury - blueprint.cost
 
 
+def test_world_connectivity():
+    state = new_game()
+    assert state.world.connected("Dry Gulch", "Lost Canyon")
+    assert state.world.connected("Riverbend", "Riverbend")
+
+
+def test_event_log_is_bounded():
+    state = new_game()
+    for index in range(40):
+        state.log_event(f"event {index}")
+    assert len(state.event_log) == 15
+    assert state.event_log[-1] == "event 39"
+
+
 def test_render_world_map_contains_territories():
     state = new_game()
     map_output = render_world_map(state)
@@ -0,0 +1,119 @@
+"""Numba-accelerated battle round kernel.
+
+Numba is an optional accelerator: when it is installed the whole round loop of
+a battle runs as one compiled call over plain ``int32`` arrays, when it is not
+the pure NumPy path in :mod:`wild_west_strategy.battle` handles every battle.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - numba is optional
+    njit = None
+
+from .entities import default_templates
+
+#: The default game only ever fields three unit templates, so their stats are
+#: frozen into module-level tables. Numba treats globals as compile-time
+#: constants, letting the specialized kernel fold the stat lookups.
+_TEMPLATES = tuple(default_templates().values())
+TEMPLATE_INDEX = {template: index for index, template in enumerate(_TEMPLATES)}
+_TEMPLATE_ATTACK = np.array([template.attack for template in _TEMPLATES], dtype=np.int32)
+_TEMPLATE_DEFENSE = np.array([template.defense for template in _TEMPLATES], dtype=np.int32)
+
+battle_kernel = None
+battle_kernel_ids = None
+batch_battles = None
+
+if njit is not None:
+
+    @njit(cache=True)
+    def battle_kernel(atk_a, def_a, hp_a, atk_d, def_d, hp_d, seed):
+        """Run up to 20 battle rounds in place and return the outcome.
+
+        Mirrors the NumPy round logic: every unit rolls ``[-3, 3]`` variance on
+        its health-scaled attack, damage is mitigated per unit by its
+        health-scaled defense, and both sides apply damage simultaneously.
+        Returns ``(attacker_losses, defender_losses, rounds, attacker_won)``.
+        """
+
+        np.random.seed(seed)
+        rounds = 0
+        attacker_losses = 0
+        defender_losses = 0
+        alive_a = 0
+        for i in range(hp_a.shape[0]):
+            if hp_a[i] > 0:
+                alive_a += 1
+        alive_d = 0
+        for i in range(hp_d.shape[0]):
+            if hp_d[i] > 0:
+                alive_d += 1
+
+        while alive_a > 0 and alive_d > 0 and rounds < 20:
+            rounds += 1
+            dmg_a = 0
+            for i in range(hp_a.shape[0]):
+                hit = atk_a[i] * hp_a[i] // 100 + np.random.randint(-3, 4)
+                if hit > 0:
+                    dmg_a += hit
+            dmg_d = 0
+            for i in range(hp_d.shape[0]):
+                hit = atk_d[i] * hp_d[i] // 100 + np.random.randint(-3, 4)
+                if hit > 0:
+                    dmg_d += hit
+
+            for i in range(hp_d.shape[0]):
+                if hp_d[i] > 0:
+                    mitigated = dmg_a - def_d[i] * hp_d[i] // 100
+                    if mitigated > 0:
+                        hp_d[i] = max(0, hp_d[i] - mitigated)
+                        if hp_d[i] == 0:
+                            defender_losses += 1
+                            alive_d -= 1
+            if alive_d == 0:
+                # The defence has collapsed; no survivors remain to return fire.
+                break
+            for i in range(hp_a.shape[0]):
+                if hp_a[i] > 0:
+                    mitigated = dmg_d - def_a[i] * hp_a[i] // 100
+                    if mitigated > 0:
+                        hp_a[i] = max(0, hp_a[i] - mitigated)
+                        if hp_a[i] == 0:
+                            attacker_losses += 1
+                            alive_a -= 1
+
+        attacker_won = alive_d == 0 and alive_a > 0
+        return attacker_losses, defender_losses, rounds, attacker_won
+
+    @njit(cache=True)
+    def battle_kernel_ids(ids_a, hp_a, ids_d, hp_d, seed):
+        """Specialized entry point for armies built from the default templates.
+
+        Units arrive as ``uint8`` template ids; the stat columns are gathered
+        from the constant-folded module tables before the shared round loop
+        runs.
+        """
+
+        atk_a = _TEMPLATE_ATTACK[ids_a]
+        def_a = _TEMPLATE_DEFENSE[ids_a]
+        atk_d = _TEMPLATE_ATTACK[ids_d]
+        def_d = _TEMPLATE_DEFENSE[ids_d]
+        return battle_kernel(atk_a, def_a, hp_a, atk_d, def_d, hp_d, seed)
+
+    @njit(parallel=True, cache=True)
+    def batch_battles(atk_a, def_a, hp_a, atk_d, def_d, hp_d, seeds, out_wins):
+        """Run one battle per seed across all cores, leaving the inputs intact.
+
+        Each iteration copies the starting health columns and seeds its
+        thread-local RNG independently, so rollouts are reproducible per seed
+        and free of cross-iteration state.
+        """
+
+        for i in prange(seeds.shape[0]):
+            _, _, _, won = battle_kernel(
+                atk_a, def_a, hp_a.copy(), atk_d, def_d, hp_d.copy(), seeds[i]
+            )
+            out_wins[i] = won
@@ -1,14 +1,20 @@
 """Battle resolution logic."""
 from __future__ import annotations
 
-import random
 from dataclasses import dataclass
-from typing import Iterable, Tuple
+from typing import Tuple
 
-from .entities import Army, Unit
+import numpy as np
 
+from ._battle_kernel import TEMPLATE_INDEX, batch_battles, battle_kernel, battle_kernel_ids
+from .entities import Army
 
-@dataclass
+#: Below this combined unit count the JIT dispatch overhead outweighs the win,
+#: so small skirmishes stay on the NumPy path.
+_KERNEL_MIN_UNITS = 32
+
+
+@dataclass(slots=True)
 class BattleReport:
     attacker_losses: int
     defender_losses: int
@@ -16,9 +22,18 @@ class BattleReport:
     rounds: int
 
 
-def simulate_round(attacking_units: Iterable[Unit], defending_units: Iterable[Unit], rng: random.Random) -> Tuple[int, int]:
-    attacker_damage = sum(max(0, unit.attack + rng.randint(-3, 3)) for unit in attacking_units)
-    defender_damage = sum(max(0, unit.attack + rng.randint(-3, 3)) for unit in defending_units)
+def _army_damage(army: Army, roll) -> int:
+    attacks, _ = army._template_arrays()
+    health = army._health_array()
+    effective = attacks * health // 100
+    rolls = roll(-3, 4, size=attacks.shape[0], dtype=np.int32)
+    return int(np.clip(effective + rolls, 0, None).sum())
+
+
+def simulate_round(attacker: Army, defender: Army, rng: np.random.Generator) -> Tuple[int, int]:
+    roll = rng.integers
+    attacker_damage = _army_damage(attacker, roll)
+    defender_damage = _army_damage(defender, roll)
     return attacker_damage, defender_damage
 
 
@@ -28,18 +43,57 @@ def resolve_battle(attacker: Army, defender: Army, seed: int | None = None) -> B
     A deterministic seed can be provided for testing purposes.
     """
 
-    rng = random.Random(seed)
+    rng = np.random.default_rng(seed)
+    if battle_kernel is not None and len(attacker.units) + len(defender.units) >= _KERNEL_MIN_UNITS:
+        return _resolve_battle_jit(attacker, defender, rng)
     rounds = 0
     attacker_losses = 0
     defender_losses = 0
+    hp_a = attacker._health_array(refresh=True)
+    hp_d = defender._health_array(refresh=True)
 
-    while attacker.has_units() and defender.has_units() and rounds < 20:
+    while (hp_a > 0).any() and (hp_d > 0).any() and rounds < 20:
         rounds += 1
-        atk_damage, def_damage = simulate_round(attacker.units, defender.units, rng)
+        atk_damage, def_damage = simulate_round(attacker, defender, rng)
         defender_losses += apply_damage(defender, atk_damage)
+        if not (hp_d > 0).any():
+            # The defence has collapsed; no survivors remain to return fire.
+            break
         attacker_losses += apply_damage(attacker, def_damage)
 
-    attacker_won = defender.has_units() is False and attacker.has_units()
+    attacker_won = not (hp_d > 0).any() and bool((hp_a > 0).any())
+    _write_back_health(attacker)
+    _write_back_health(defender)
+    defender.remove_dead()
+    attacker.remove_dead()
+    return BattleReport(
+        attacker_losses=attacker_losses,
+        defender_losses=defender_losses,
+        attacker_won=attacker_won,
+        rounds=rounds,
+    )
+
+
+def _resolve_battle_jit(attacker: Army, defender: Army, rng: np.random.Generator) -> BattleReport:
+    """Resolve a large battle in a single compiled kernel call."""
+
+    hp_a = attacker._health_array(refresh=True)
+    hp_d = defender._health_array(refresh=True)
+    seed = int(rng.integers(0, 2**31))
+    ids_a = _template_ids(attacker)
+    ids_d = _template_ids(defender)
+    if battle_kernel_ids is not None and ids_a is not None and ids_d is not None:
+        attacker_losses, defender_losses, rounds, attacker_won = battle_kernel_ids(
+            ids_a, hp_a, ids_d, hp_d, seed
+        )
+    else:
+        atk_a, def_a = attacker._template_arrays()
+        atk_d, def_d = defender._template_arrays()
+        attacker_losses, defender_losses, rounds, attacker_won = battle_kernel(
+            atk_a, def_a, hp_a, atk_d, def_d, hp_d, seed
+        )
+    _write_back_health(attacker)
+    _write_back_health(defender)
     defender.remove_dead()
     attacker.remove_dead()
     return BattleReport(
@@ -51,12 +105,91 @@ def resolve_battle(attacker: Army, defender: Army, seed: int | None = None) -> B
 
 
 def apply_damage(army: Army, damage: int) -> int:
-    losses = 0
-    for unit in army.units:
-        if not unit.is_alive():
-            continue
-        mitigated = max(0, damage - unit.defense)
-        unit.health = max(0, unit.health - mitigated)
-        if unit.health == 0:
-            losses += 1
+    """Apply army-wide damage to the health column and return units lost.
+
+    Branchless: dead units are masked out arithmetically instead of skipped,
+    so the whole update runs as a handful of vectorized array ops.
+    """
+
+    _, defense = army._template_arrays()
+    health = army._health_array()
+    mitigated = np.maximum(0, damage - defense * health // 100) * (health > 0)
+    new_health = np.maximum(0, health - mitigated)
+    losses = int(((health > 0) & (new_health == 0)).sum())
+    health[:] = new_health
     return losses
+
+
+def resolve_battles_batch(attacker: Army, defender: Army, seeds) -> np.ndarray:
+    """Simulate the same matchup under many seeds without mutating the armies.
+
+    Returns a boolean array of attacker wins, one per seed — useful for AI
+    rollouts that want a win-rate estimate rather than an applied outcome.
+    With numba installed the rollouts run in parallel across cores.
+    """
+
+    atk_a, def_a = attacker._template_arrays()
+    atk_d, def_d = defender._template_arrays()
+    hp_a = attacker._health_array(refresh=True)
+    hp_d = defender._health_array(refresh=True)
+    seeds = np.asarray(seeds, dtype=np.int64)
+    wins = np.zeros(seeds.shape[0], dtype=np.bool_)
+    if batch_battles is not None:
+        batch_battles(atk_a, def_a, hp_a, atk_d, def_d, hp_d, seeds, wins)
+        return wins
+    for i in range(seeds.shape[0]):
+        rng = np.random.default_rng(int(seeds[i]))
+        wins[i] = _battle_outcome(atk_a, def_a, hp_a.copy(), atk_d, def_d, hp_d.copy(), rng)
+    return wins
+
+
+def _battle_outcome(atk_a, def_a, hp_a, atk_d, def_d, hp_d, rng: np.random.Generator) -> bool:
+    """Pure NumPy rollout of one battle over scratch health columns."""
+
+    rounds = 0
+    while (hp_a > 0).any() and (hp_d > 0).any() and rounds < 20:
+        rounds += 1
+        roll = rng.integers
+        dmg_a = int(np.clip(atk_a * hp_a // 100 + roll(-3, 4, size=hp_a.shape[0], dtype=np.int32), 0, None).sum())
+        dmg_d = int(np.clip(atk_d * hp_d // 100 + roll(-3, 4, size=hp_d.shape[0], dtype=np.int32), 0, None).sum())
+        hp_d = np.maximum(0, hp_d - np.maximum(0, dmg_a - def_d * hp_d // 100) * (hp_d > 0))
+        if not (hp_d > 0).any():
+            break
+        hp_a = np.maximum(0, hp_a - np.maximum(0, dmg_d - def_a * hp_a // 100) * (hp_a > 0))
+    return bool((hp_a > 0).any() and not (hp_d > 0).any())
+
+
+def warm_up() -> None:
+    """Trigger JIT compilation of the battle kernels on dummy data.
+
+    With numba installed the first battle otherwise pays the compile (or
+    disk-cache load) latency mid-game; calling this at startup moves that
+    cost to launch. A no-op when numba is unavailable.
+    """
+
+    if battle_kernel is None:
+        return
+    stats = np.ones(1, dtype=np.int32)
+    health = np.full(1, 100, dtype=np.int32)
+    battle_kernel(stats, stats, health.copy(), stats, stats, health.copy(), 0)
+    if battle_kernel_ids is not None:
+        ids = np.zeros(1, dtype=np.uint8)
+        battle_kernel_ids(ids, health.copy(), ids, health.copy(), 0)
+
+
+def _template_ids(army: Army):
+    """Pack an army into default-template ids, or None for custom templates."""
+
+    try:
+        return np.fromiter(
+            (TEMPLATE_INDEX[unit.template] for unit in army.units),
+            dtype=np.uint8,
+            count=len(army.units),
+        )
+    except KeyError:
+        return None
+
+
+def _write_back_health(army: Army) -> None:
+    for unit, health in zip(army.units, army._health_array()):
+        unit.health = int(health)
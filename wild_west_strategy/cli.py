@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from typing import Callable, Dict
 
+from .battle import warm_up
 from .game import GameState, new_game
 from .ui import render_status_panel, render_world_map
 
@@ -123,6 +124,7 @@ def main() -> None:
         "q": ("Quit", action_quit),
     }
     print("Welcome to Frontier Dominion! Lead the Frontier League to victory.")
+    warm_up()
     while not state.game_over:
         print()
         print(render_status_panel(state))
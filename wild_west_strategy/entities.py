@@ -3,7 +3,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, Iterable, List
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
 
 
 class UnitClass(Enum):
@@ -32,55 +35,175 @@ class UnitTemplate:
         )
 
 
-@dataclass
 class Unit:
-    """A single unit on the battlefield."""
+    """A single unit on the battlefield.
 
-    template: UnitTemplate
-    health: int = 100
+    ``attack`` and ``defense`` are plain attributes recomputed by the
+    ``health`` setter rather than properties, so the hot battle paths pay a
+    single field read instead of a descriptor dispatch plus arithmetic on
+    every access.
+    """
 
-    @property
-    def attack(self) -> int:
-        return self.template.attack * self.health // 100
+    __slots__ = ("template", "_health", "attack", "defense", "_army")
+
+    def __init__(self, template: UnitTemplate, health: int = 100) -> None:
+        self.template = template
+        self._army: Optional[Army] = None
+        self._health = 0
+        self.health = health
 
     @property
-    def defense(self) -> int:
-        return self.template.defense * self.health // 100
+    def health(self) -> int:
+        return self._health
+
+    @health.setter
+    def health(self, value: int) -> None:
+        army = self._army
+        if army is not None:
+            army._on_unit_health_change(self._health, value)
+        self._health = value
+        self.attack = self.template.attack * value // 100
+        self.defense = self.template.defense * value // 100
 
     def is_alive(self) -> bool:
-        return self.health > 0
+        return self._health > 0
 
+    def __repr__(self) -> str:
+        return f"Unit(template={self.template!r}, health={self._health})"
 
-@dataclass
+
+@dataclass(slots=True)
 class Army:
     """Collection of combat units."""
 
     name: str
     units: List[Unit] = field(default_factory=list)
     supplies: int = 0
+    _attack_arr: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
+    _defense_arr: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
+    _health_arr: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
+    _alive_count: int = field(default=0, init=False, repr=False, compare=False)
+    _strength_total: int = field(default=0, init=False, repr=False, compare=False)
+    _upkeep_total: int = field(default=0, init=False, repr=False, compare=False)
+    _totals_dirty: bool = field(default=True, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        for unit in self.units:
+            unit._army = self
+        self._alive_count = sum(1 for unit in self.units if unit.is_alive())
 
     def strength(self) -> int:
         """Return combined combat strength of the army."""
 
-        return sum(unit.attack + unit.defense for unit in self.units if unit.is_alive())
+        if self._totals_dirty:
+            self._recompute_totals()
+        return self._strength_total
 
     def upkeep(self) -> int:
-        return sum(unit.template.upkeep for unit in self.units if unit.is_alive())
+        if self._totals_dirty:
+            self._recompute_totals()
+        return self._upkeep_total
+
+    def _recompute_totals(self) -> None:
+        self._strength_total = sum(unit.attack + unit.defense for unit in self.units if unit.is_alive())
+        self._upkeep_total = sum(unit.template.upkeep for unit in self.units if unit.is_alive())
+        self._totals_dirty = False
+
+    def _on_unit_health_change(self, old: int, new: int) -> None:
+        """Keep liveness and total caches honest when a member's health moves."""
+
+        if (old > 0) != (new > 0):
+            self._alive_count += 1 if new > 0 else -1
+        self._health_arr = None
+        self._totals_dirty = True
 
     def add_unit(self, unit: Unit) -> None:
+        unit._army = self
         self.units.append(unit)
+        if unit.is_alive():
+            self._alive_count += 1
+        self._totals_dirty = True
+        self._invalidate_arrays()
+
+    def add_units(self, units: List[Unit]) -> None:
+        """Append a batch of units with one list extend and one invalidation."""
+
+        for unit in units:
+            unit._army = self
+        self.units.extend(units)
+        self._alive_count += sum(1 for unit in units if unit.is_alive())
+        self._totals_dirty = True
+        self._invalidate_arrays()
 
     def remove_dead(self) -> None:
-        self.units = [unit for unit in self.units if unit.is_alive()]
+        if self._alive_count == len(self.units):
+            return
+        units = self.units
+        write = 0
+        for unit in units:
+            if unit.is_alive():
+                units[write] = unit
+                write += 1
+        if write == len(units):
+            self._alive_count = write
+            return
+        del units[write:]
+        self._alive_count = write
+        self._invalidate_arrays()
+
+    def _template_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Return cached per-unit template attack/defense columns.
+
+        The cache only depends on army membership, so it is invalidated by
+        :meth:`add_unit` and :meth:`remove_dead` rather than rebuilt per battle
+        round.
+        """
+
+        if self._attack_arr is None:
+            count = len(self.units)
+            self._attack_arr = np.fromiter(
+                (unit.template.attack for unit in self.units), dtype=np.int32, count=count
+            )
+            self._defense_arr = np.fromiter(
+                (unit.template.defense for unit in self.units), dtype=np.int32, count=count
+            )
+        return self._attack_arr, self._defense_arr
+
+    def _health_array(self, refresh: bool = False) -> np.ndarray:
+        """Return the per-unit health column, rebuilding it on request.
+
+        During a battle the array is the source of truth and is mutated in
+        place; :func:`wild_west_strategy.battle.resolve_battle` refreshes it on
+        entry and writes it back to the units when the fighting ends.
+        """
+
+        if refresh or self._health_arr is None:
+            self._health_arr = np.fromiter(
+                (unit.health for unit in self.units), dtype=np.int32, count=len(self.units)
+            )
+        return self._health_arr
+
+    def _invalidate_arrays(self) -> None:
+        self._attack_arr = None
+        self._defense_arr = None
+        self._health_arr = None
+
+    def clear(self) -> None:
+        """Disband every unit, resetting the liveness and total caches."""
+
+        self.units.clear()
+        self._alive_count = 0
+        self._totals_dirty = True
+        self._invalidate_arrays()
 
     def consume_supplies(self) -> None:
         self.supplies = max(0, self.supplies - len(self.units))
 
     def has_units(self) -> bool:
-        return any(unit.is_alive() for unit in self.units)
+        return self._alive_count > 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Settlement:
     """A settlement the player can manage."""
 
@@ -90,28 +213,38 @@ class Settlement:
     defenses: int
     garrison: Army = field(default_factory=lambda: Army("Town Guard"))
     structures: Dict[str, int] = field(default_factory=dict)
+    _income_cache: Optional[int] = field(default=None, init=False, repr=False, compare=False)
 
     def income(self) -> int:
-        base = self.population // 100 + self.prosperity
-        bonus = sum(level * 5 for level in self.structures.values())
-        return base + bonus
+        # Income only moves when prosperity or structures do, so the sum is
+        # cached and dropped by improve_structure.
+        if self._income_cache is None:
+            base = self.population // 100 + self.prosperity
+            bonus = sum(level * 5 for level in self.structures.values())
+            self._income_cache = base + bonus
+        return self._income_cache
 
     def improve_structure(self, structure: str, blueprint: StructureBlueprint | None = None) -> int:
         current = self.structures.get(structure, 0) + 1
         self.structures[structure] = current
         bonus = blueprint.prosperity_bonus if blueprint else 1
         self.prosperity += bonus
+        self._income_cache = None
         return current
 
     def recruit(self, template: UnitTemplate, quantity: int = 1) -> List[Unit]:
         recruits = [Unit(template=template) for _ in range(quantity)]
-        for recruit in recruits:
-            self.garrison.add_unit(recruit)
+        self.garrison.add_units(recruits)
         return recruits
 
 
+@lru_cache(maxsize=None)
 def default_templates() -> Dict[str, UnitTemplate]:
-    """Return the default unit templates for the game."""
+    """Return the default unit templates for the game.
+
+    The templates are frozen, so the mapping is built once and shared by
+    every caller instead of re-instantiating the dataclasses per call.
+    """
 
     return {
         "militia": UnitTemplate(
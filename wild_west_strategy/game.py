@@ -2,8 +2,10 @@
 from __future__ import annotations
 
 import random
+import sys
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Deque, Dict, List, Optional
 
 from .battle import BattleReport, resolve_battle
 from .entities import (
@@ -12,10 +14,10 @@ from .entities import (
     default_structures,
     default_templates,
 )
-from .world import Faction, World, create_default_world
+from .world import Faction, World, create_default_world, standings_key
 
 
-@dataclass
+@dataclass(slots=True)
 class GameConfig:
     max_turns: int = 25
     starting_templates: Dict[str, UnitTemplate] = field(default_factory=default_templates)
@@ -24,16 +26,23 @@ class GameConfig:
     ai_attack_probability: float = 0.4
 
 
-@dataclass
+@dataclass(slots=True)
 class GameState:
     world: World
     player_faction: str
     turn: int = 1
     config: GameConfig = field(default_factory=GameConfig)
-    event_log: List[str] = field(default_factory=list)
+    event_log: Deque[str] = field(default_factory=lambda: deque(maxlen=15))
     game_over: bool = False
     victor: Optional[str] = None
     rng: random.Random = field(default_factory=random.Random)
+    _enemies_cache: Optional[List[Faction]] = field(default=None, init=False, repr=False, compare=False)
+    _standings_cache: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Faction names are interned at construction; interning the player's
+        # pick keeps name comparisons on the pointer-equality fast path.
+        self.player_faction = sys.intern(self.player_faction)
 
     def current_faction(self) -> Faction:
         return self.world.faction(self.player_faction)
@@ -46,11 +55,15 @@ class GameState:
 
     def log_event(self, message: str) -> None:
         self.event_log.append(message)
-        if len(self.event_log) > 15:
-            self.event_log.pop(0)
 
     def enemies(self) -> List[Faction]:
-        return [f for name, f in self.world.factions.items() if name != self.player_faction]
+        # The faction roster and player choice are fixed for a session, so the
+        # list is built once; invalidate the cache if either ever changes.
+        if self._enemies_cache is None:
+            self._enemies_cache = [
+                f for name, f in self.world.factions.items() if name != self.player_faction
+            ]
+        return self._enemies_cache
 
     def recruit(self, settlement_name: str, template_key: str, quantity: int = 1) -> int:
         templates = self.available_recruits()
@@ -64,6 +77,7 @@ class GameState:
         if faction.treasury < total_cost:
             raise ValueError("Insufficient funds for recruitment")
         faction.treasury -= total_cost
+        self._invalidate_standings()
         faction.territories[settlement_name].settlement.recruit(template, quantity)
         self.log_event(
             f"{faction.name} raised {quantity} unit{'s' if quantity != 1 else ''} of {template.name} in {settlement_name}."
@@ -74,6 +88,7 @@ class GameState:
         faction = self.current_faction()
         income = faction.income()
         faction.treasury += income
+        self._invalidate_standings()
         self.log_event(f"{faction.name} collected ${income} in revenue.")
         return income
 
@@ -88,9 +103,11 @@ class GameState:
         if faction.treasury < blueprint.cost:
             raise ValueError("Insufficient funds for construction")
         faction.treasury -= blueprint.cost
+        self._invalidate_standings()
         level = faction.territories[settlement_name].settlement.improve_structure(
             structure_key, blueprint
         )
+        faction._prosperity_sum = None
         self.log_event(
             f"{settlement_name} upgraded the {blueprint.name} to level {level}."
         )
@@ -101,6 +118,7 @@ class GameState:
             return
         faction = self.current_faction()
         faction.pay_upkeep()
+        self._invalidate_standings()
         faction.reinforce_garrisons()
         self.log_event(f"{faction.name} paid upkeep and reinforced garrisons.")
         self._run_ai_turns()
@@ -128,7 +146,7 @@ class GameState:
             raise ValueError("Cannot attack from a territory you do not control")
         attacker_territory = attacker_faction.territories[attacking_territory]
         defender_territory = self.world.territory(defending_territory)
-        if defending_territory not in attacker_territory.neighbors:
+        if defending_territory not in attacker_territory.neighbor_set:
             raise ValueError("Territories must be adjacent to attack")
         attacker_army = attacker_territory.settlement.garrison
         defender_army = defender_territory.settlement.garrison
@@ -137,7 +155,9 @@ class GameState:
             loser_faction = self.world.faction(defender_territory.controlling_faction)
             loser_faction.remove_territory(defending_territory)
             attacker_faction.add_territory(defender_territory)
-            defender_territory.settlement.garrison.units.clear()
+            self.world.invalidate_hostility_caches()
+            self._invalidate_standings()
+            defender_territory.settlement.garrison.clear()
             defender_territory.settlement.recruit(self.config.starting_templates["militia"], 1)
         return report
 
@@ -157,13 +177,13 @@ class GameState:
         income = faction.income()
         if income:
             faction.treasury += income
+            self._invalidate_standings()
             self.log_event(f"{faction.name} collected ${income} in taxes.")
 
     def _ai_recruit(self, faction: Faction) -> None:
-        settlements = list(faction.territories.values())
-        if not settlements:
+        settlement = faction.top_population_territory()
+        if settlement is None:
             return
-        settlement = max(settlements, key=lambda terr: terr.settlement.population)
         templates = list(self.available_recruits().values())
         if not templates:
             return
@@ -176,23 +196,28 @@ class GameState:
         if cost > faction.treasury:
             return
         faction.treasury -= cost
+        self._invalidate_standings()
         settlement.settlement.recruit(template, quantity)
         self.log_event(
             f"{faction.name} recruited {quantity} {template.name} in {settlement.name}."
         )
 
     def _ai_attack(self, faction: Faction) -> None:
-        potential_attacks: List[tuple[str, str]] = []
-        for territory in sorted(faction.territories.values(), key=lambda terr: terr.name):
+        # Reservoir sampling (Algorithm R, k=1): pick uniformly from the
+        # candidate stream without materializing every (origin, target) pair.
+        chosen: Optional[tuple[str, str]] = None
+        candidates = 0
+        hostile = faction.hostile_neighbors(self.world)
+        for territory in faction.territories.values():
             if not territory.settlement.garrison.has_units():
                 continue
-            for neighbor in territory.neighbors:
-                owner = self.world.territory(neighbor).controlling_faction
-                if owner != faction.name:
-                    potential_attacks.append((territory.name, neighbor))
-        if not potential_attacks:
+            for neighbor in hostile.get(territory.name, ()):
+                candidates += 1
+                if self.rng.randrange(candidates) == 0:
+                    chosen = (territory.name, neighbor)
+        if chosen is None:
             return
-        origin, target = self.rng.choice(potential_attacks)
+        origin, target = chosen
         report = self._resolve_attack(faction.name, origin, target)
         if report.attacker_won:
             self.log_event(
@@ -207,17 +232,12 @@ class GameState:
         if self.game_over:
             return
         player = self.current_faction()
-        enemy_territories = [
-            territory
-            for faction in self.enemies()
-            for territory in faction.territories.values()
-        ]
         if not player.territories:
             self.game_over = True
             self.victor = "Defeat"
             self.log_event("Your influence has collapsed across the frontier.")
             return
-        if not enemy_territories:
+        if not any(faction.territories for faction in self.enemies()):
             self.game_over = True
             self.victor = "Victory"
             self.log_event("All rival factions have been subdued. The frontier is yours!")
@@ -238,11 +258,11 @@ class GameState:
     def describe_state(self) -> str:
         faction = self.current_faction()
         territories: List[str] = []
-        for territory in sorted(faction.territories.values(), key=lambda terr: terr.name):
+        for territory in faction.sorted_territories():
             settlement = territory.settlement
             garrison = settlement.garrison
             structures = ", ".join(
-                f"{name} Lv.{level}" for name, level in settlement.structures.items()
+                [f"{name} Lv.{level}" for name, level in settlement.structures.items()]
             )
             if not structures:
                 structures = "No upgrades"
@@ -251,30 +271,37 @@ class GameState:
                 f"garrison {len(garrison.units)} units, structures [{structures}]"
             )
         standings = self._faction_standings()
-        events = "\n".join(self.event_log[-5:]) if self.event_log else "No notable events yet."
-        status = f"Turn {self.turn}/{self.config.max_turns} - Treasury ${faction.treasury}\n"
-        status += "Your Territories:\n" + "\n".join(territories)
-        status += "\n\nFaction Standings:\n" + standings
-        status += "\n\nRecent Events:\n" + events
+        events = "\n".join(list(self.event_log)[-5:]) if self.event_log else "No notable events yet."
+        parts = [
+            f"Turn {self.turn}/{self.config.max_turns} - Treasury ${faction.treasury}",
+            "Your Territories:",
+            *territories,
+            "",
+            "Faction Standings:",
+            standings,
+            "",
+            "Recent Events:",
+            events,
+        ]
         if self.game_over and self.victor:
-            status += f"\n\nOutcome: {self.victor}!"
-        return status
+            parts.append("")
+            parts.append(f"Outcome: {self.victor}!")
+        return "\n".join(parts)
+
+    def _invalidate_standings(self) -> None:
+        self._standings_cache = None
 
     def _faction_standings(self) -> str:
-        factions = list(self.world.factions.values())
-        standings = sorted(
-            (
-                faction.name,
-                len(faction.territories),
-                faction.treasury,
-            )
-            for faction in factions
-        )
-        standings.sort(key=lambda item: (-item[1], -item[2], item[0]))
-        lines = [
-            f"{name}: {territories} territories, treasury ${treasury}" for name, territories, treasury in standings
-        ]
-        return "\n".join(lines)
+        # Rebuilt only after a treasury or territory mutation; the status
+        # panel is often rendered several times per turn in between.
+        if self._standings_cache is None:
+            standings = sorted(self.world.factions.values(), key=standings_key)
+            lines = [
+                f"{faction.name}: {len(faction.territories)} territories, treasury ${faction.treasury}"
+                for faction in standings
+            ]
+            self._standings_cache = "\n".join(lines)
+        return self._standings_cache
 
 
 def new_game(player_faction: str = "Frontier League") -> GameState:
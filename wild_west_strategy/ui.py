@@ -1,9 +1,11 @@
 """Utility helpers for rendering game information."""
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Iterable
 
 from .game import GameState
+from .world import standings_key
 
 FACTION_SYMBOLS = {
     "Frontier League": "★",
@@ -11,39 +13,56 @@ FACTION_SYMBOLS = {
     "Canyon Syndicate": "♠",
 }
 
+#: Placeholder key → territory name for the fixed map layout below.
+_MAP_SLOTS = {
+    "dg": "Dry Gulch",
+    "cr": "Copper Ridge",
+    "rb": "Riverbend",
+    "mv": "Mesa Verde",
+    "ss": "Silver Springs",
+    "lc": "Lost Canyon",
+}
+
+#: The box-drawing skeleton never changes; only the six badges do, so a single
+#: str.format fills in a refreshed map.
+_MAP_TEMPLATE = "\n".join(
+    [
+        "{dg:<32}─── {cr:<32}─── {rb}",
+        " " * 14 + "\\" + " " * 27 + "/",
+        " " * 15 + "{mv:<32}─── {ss}",
+        " " * 52 + "│",
+        " " * 49 + "{lc}",
+        "",
+        "Legend: ★ You | ♞ Desert Union | ♠ Canyon Syndicate | ✦ Other faction",
+    ]
+)
+
 
+@lru_cache(maxsize=16)
 def _faction_symbol(faction_name: str, player_faction: str) -> str:
     if faction_name == player_faction:
         return "★"
     return FACTION_SYMBOLS.get(faction_name, "✦")
 
 
+@lru_cache(maxsize=64)
+def _badge(territory_name: str, owner: str, player_faction: str) -> str:
+    # The owner is part of the key, so a conquest simply hits a new entry —
+    # no invalidation hooks required.
+    symbol = _faction_symbol(owner, player_faction)
+    return f"{territory_name} {symbol} ({owner})"
+
+
 def territory_badge(state: GameState, territory_name: str) -> str:
     territory = state.world.territory(territory_name)
-    symbol = _faction_symbol(territory.controlling_faction, state.player_faction)
-    return f"{territory_name} {symbol} ({territory.controlling_faction})"
+    return _badge(territory_name, territory.controlling_faction, state.player_faction)
 
 
 def render_world_map(state: GameState) -> str:
     """Render a stylised ASCII map of the frontier."""
 
-    dg = territory_badge(state, "Dry Gulch")
-    cr = territory_badge(state, "Copper Ridge")
-    rb = territory_badge(state, "Riverbend")
-    mv = territory_badge(state, "Mesa Verde")
-    ss = territory_badge(state, "Silver Springs")
-    lc = territory_badge(state, "Lost Canyon")
-
-    lines = [
-        f"{dg:<32}─── {cr:<32}─── {rb}",
-        " " * 14 + "\\" + " " * 27 + "/",
-        f"{'':>15}{mv:<32}─── {ss}",
-        " " * 52 + "│",
-        " " * 49 + lc,
-        "",
-        "Legend: ★ You | ♞ Desert Union | ♠ Canyon Syndicate | ✦ Other faction",
-    ]
-    return "\n".join(lines)
+    badges = {key: territory_badge(state, name) for key, name in _MAP_SLOTS.items()}
+    return _MAP_TEMPLATE.format(**badges)
 
 
 def render_status_panel(state: GameState, event_count: int = 5) -> str:
@@ -53,27 +72,26 @@ def render_status_panel(state: GameState, event_count: int = 5) -> str:
     header = (
         f"=== Turn {state.turn}/{state.config.max_turns} | "
         f"Treasury: ${faction.treasury} | Prosperity: "
-        f"{sum(t.settlement.prosperity for t in faction.territories.values())} ==="
+        f"{faction.prosperity()} ==="
     )
 
-    territory_details = [
-        f"{territory.name}: pop {territory.settlement.population}, "
-        f"prosperity {territory.settlement.prosperity}, "
-        f"garrison {len(territory.settlement.garrison.units)} units"
-        for territory in sorted(faction.territories.values(), key=lambda terr: terr.name)
-    ]
+    territory_details = []
+    for territory in faction.sorted_territories():
+        settlement = territory.settlement
+        territory_details.append(
+            f"{territory.name}: pop {settlement.population}, "
+            f"prosperity {settlement.prosperity}, "
+            f"garrison {len(settlement.garrison.units)} units"
+        )
 
     standings = [
         f"{f.name}: territories {len(f.territories)}, treasury ${f.treasury}"
-        for f in sorted(
-            state.world.factions.values(),
-            key=lambda fac: (-len(fac.territories), -fac.treasury, fac.name),
-        )
+        for f in sorted(state.world.factions.values(), key=standings_key)
     ]
 
     events: Iterable[str]
     if state.event_log:
-        events = state.event_log[-event_count:]
+        events = list(state.event_log)[-event_count:]
     else:
         events = ["No major events yet."]
 
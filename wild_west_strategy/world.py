@@ -1,26 +1,99 @@
 """World map and factions."""
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from operator import attrgetter
+from typing import Dict, Optional, Tuple
 
 from .entities import Army, Settlement, default_templates
 
 
-@dataclass
+@dataclass(slots=True)
 class Territory:
     name: str
     settlement: Settlement
-    neighbors: List[str]
+    neighbors: Tuple[str, ...]
     controlling_faction: str
+    #: Frozen mirror of ``neighbors`` for O(1) adjacency tests; the tuple keeps
+    #: a stable iteration order for menus and the map.
+    neighbor_set: frozenset = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        # Interned names make the pervasive dict lookups and equality checks
+        # on territory keys a pointer comparison in CPython.
+        self.name = sys.intern(self.name)
+        self.neighbors = tuple(sys.intern(neighbor) for neighbor in self.neighbors)
+        self.neighbor_set = frozenset(self.neighbors)
 
-@dataclass
+
+@dataclass(slots=True)
 class Faction:
     name: str
     treasury: int
     territories: Dict[str, Territory] = field(default_factory=dict)
     armies: Dict[str, Army] = field(default_factory=dict)
+    _top_pop_territory: Optional[Territory] = field(default=None, init=False, repr=False, compare=False)
+    _hostile_cache: Optional[Dict[str, Tuple[str, ...]]] = field(default=None, init=False, repr=False, compare=False)
+    _sorted_territories: Optional[Tuple[Territory, ...]] = field(default=None, init=False, repr=False, compare=False)
+    _prosperity_sum: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.name = sys.intern(self.name)
+
+    def prosperity(self) -> int:
+        """Return total settlement prosperity, cached between changes.
+
+        Invalidated on territory gain/loss here and by build_structure when a
+        settlement upgrade raises its prosperity.
+        """
+
+        if self._prosperity_sum is None:
+            self._prosperity_sum = sum(
+                territory.settlement.prosperity for territory in self.territories.values()
+            )
+        return self._prosperity_sum
+
+    def sorted_territories(self) -> Tuple[Territory, ...]:
+        """Return controlled territories in name order, cached between changes."""
+
+        if self._sorted_territories is None:
+            self._sorted_territories = tuple(
+                sorted(self.territories.values(), key=attrgetter("name"))
+            )
+        return self._sorted_territories
+
+    def hostile_neighbors(self, world: World) -> Dict[str, Tuple[str, ...]]:
+        """Map each controlled territory to its enemy-held neighbors.
+
+        Ownership only moves through conquest, so the mapping is computed
+        once and reused until a territory changes hands anywhere on the map
+        (see :meth:`World.invalidate_hostility_caches`).
+        """
+
+        if self._hostile_cache is None:
+            self._hostile_cache = {
+                name: tuple(
+                    neighbor
+                    for neighbor in territory.neighbors
+                    if world.territory(neighbor).controlling_faction != self.name
+                )
+                for name, territory in self.territories.items()
+            }
+        return self._hostile_cache
+
+    def top_population_territory(self) -> Optional[Territory]:
+        """Return the controlled territory with the largest settlement.
+
+        Populations are static, so the answer only changes when territory
+        membership does; add/remove invalidate the cache.
+        """
+
+        if self._top_pop_territory is None and self.territories:
+            self._top_pop_territory = max(
+                self.territories.values(), key=attrgetter("settlement.population")
+            )
+        return self._top_pop_territory
 
     def income(self) -> int:
         return sum(territory.settlement.income() for territory in self.territories.values())
@@ -39,15 +112,43 @@ class Faction:
     def add_territory(self, territory: Territory) -> None:
         self.territories[territory.name] = territory
         territory.controlling_faction = self.name
+        self._top_pop_territory = None
+        self._hostile_cache = None
+        self._sorted_territories = None
+        self._prosperity_sum = None
 
     def remove_territory(self, territory_name: str) -> Optional[Territory]:
+        self._top_pop_territory = None
+        self._hostile_cache = None
+        self._sorted_territories = None
+        self._prosperity_sum = None
         return self.territories.pop(territory_name, None)
 
 
-@dataclass
+@dataclass(slots=True)
 class World:
     territories: Dict[str, Territory]
     factions: Dict[str, Faction]
+    _components: Dict[str, str] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Geography is static, so connected components are labelled once with
+        # union-find and connectivity queries become two dict lookups.
+        parent = {name: name for name in self.territories}
+
+        def find(name: str) -> str:
+            root = name
+            while parent[root] != root:
+                root = parent[root]
+            while parent[name] != root:
+                parent[name], name = root, parent[name]
+            return root
+
+        for name, territory in self.territories.items():
+            for neighbor in territory.neighbors:
+                if neighbor in parent:
+                    parent[find(name)] = find(neighbor)
+        self._components = {name: find(name) for name in parent}
 
     def territory(self, name: str) -> Territory:
         return self.territories[name]
@@ -55,18 +156,18 @@ class World:
     def faction(self, name: str) -> Faction:
         return self.factions[name]
 
+    def invalidate_hostility_caches(self) -> None:
+        """Drop every faction's hostile-neighbor cache after a conquest.
+
+        A single territory changing hands can affect the hostile borders of
+        any faction adjacent to it, not just the two involved.
+        """
+
+        for faction in self.factions.values():
+            faction._hostile_cache = None
+
     def connected(self, start: str, end: str) -> bool:
-        visited = set()
-        stack = [start]
-        while stack:
-            current = stack.pop()
-            if current == end:
-                return True
-            if current in visited:
-                continue
-            visited.add(current)
-            stack.extend(self.territories[current].neighbors)
-        return False
+        return self._components[start] == self._components[end]
 
     def move_army(self, faction_name: str, army_name: str, destination: str) -> None:
         faction = self.faction(faction_name)
@@ -74,16 +175,19 @@ class World:
             raise ValueError(f"Faction {faction_name} has no army named {army_name}")
         army = faction.armies[army_name]
         for territory in faction.territories.values():
-            if army in territory.settlement.garrison.units:
+            if army is territory.settlement.garrison:
                 raise ValueError("Army is part of a garrison and cannot move independently")
-        # movement is abstracted; we simply note the army's current location via dictionary
-        for territory in self.territories.values():
-            if territory.name == destination:
-                if destination not in faction.territories:
-                    raise ValueError("Armies may only move within controlled territory")
-                # track by storing mapping in armies dict
-                break
-        faction.armies[army_name] = army
+        # movement is abstracted; the guards below are the whole operation
+        if destination not in self.territories:
+            raise ValueError(f"Unknown destination: {destination}")
+        if destination not in faction.territories:
+            raise ValueError("Armies may only move within controlled territory")
+
+
+def standings_key(faction: Faction) -> tuple:
+    """Sort factions by territory count, then treasury, then name."""
+
+    return (-len(faction.territories), -faction.treasury, faction.name)
 
 
 def create_default_world() -> World:
@@ -92,37 +196,37 @@ def create_default_world() -> World:
     dry_gulch = Territory(
         name="Dry Gulch",
         settlement=Settlement(name="Dry Gulch", population=1200, prosperity=3, defenses=5),
-        neighbors=["Copper Ridge", "Mesa Verde"],
+        neighbors=("Copper Ridge", "Mesa Verde"),
         controlling_faction="Frontier League",
     )
     copper_ridge = Territory(
         name="Copper Ridge",
         settlement=Settlement(name="Copper Ridge", population=950, prosperity=3, defenses=4),
-        neighbors=["Dry Gulch", "Riverbend", "Mesa Verde", "Silver Springs"],
+        neighbors=("Dry Gulch", "Riverbend", "Mesa Verde", "Silver Springs"),
         controlling_faction="Frontier League",
     )
     mesa_verde = Territory(
         name="Mesa Verde",
         settlement=Settlement(name="Mesa Verde", population=800, prosperity=2, defenses=4),
-        neighbors=["Dry Gulch", "Copper Ridge", "Silver Springs"],
+        neighbors=("Dry Gulch", "Copper Ridge", "Silver Springs"),
         controlling_faction="Frontier League",
     )
     riverbend = Territory(
         name="Riverbend",
         settlement=Settlement(name="Riverbend", population=1500, prosperity=4, defenses=6),
-        neighbors=["Copper Ridge", "Silver Springs", "Lost Canyon"],
+        neighbors=("Copper Ridge", "Silver Springs", "Lost Canyon"),
         controlling_faction="Desert Union",
     )
     silver_springs = Territory(
         name="Silver Springs",
         settlement=Settlement(name="Silver Springs", population=1100, prosperity=3, defenses=5),
-        neighbors=["Mesa Verde", "Copper Ridge", "Riverbend", "Lost Canyon"],
+        neighbors=("Mesa Verde", "Copper Ridge", "Riverbend", "Lost Canyon"),
         controlling_faction="Desert Union",
     )
     lost_canyon = Territory(
         name="Lost Canyon",
         settlement=Settlement(name="Lost Canyon", population=700, prosperity=2, defenses=5),
-        neighbors=["Riverbend", "Silver Springs"],
+        neighbors=("Riverbend", "Silver Springs"),
         controlling_faction="Canyon Syndicate",
     )
 